@@ -2,11 +2,43 @@
 
 from __future__ import annotations
 
+import os
+import secrets
+import shutil
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Protocol, runtime_checkable
 
+from pydantic import TypeAdapter
+
 from pydantic_ai_todo.types import Todo
 
+# Serializes todo lists in pydantic-core, without a per-item model_dump() round trip.
+_todo_list_adapter = TypeAdapter(list[Todo])
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temp file in the same directory.
+
+    The target is only ever replaced by a complete file, so a crash mid-write
+    can't leave a truncated todo list behind. A new file gets the default mode
+    (honouring the umask) and an existing file keeps its mode.
+    """
+    tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+    # Opened outside the try so a name collision never unlinks someone else's file
+    f = open(tmp_path, "xb")  # noqa: SIM115 - closed by the with block below
+    try:
+        with f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink()
+        raise
+
 
 @runtime_checkable
 class TodoStorageProtocol(Protocol):
@@ -15,6 +47,11 @@ class TodoStorageProtocol(Protocol):
     Any class that has a `todos` property (read/write) implementing
     `list[Todo]` can be used as storage for the todo toolset.
 
+    The protocol is runtime checkable, but `isinstance()` against it is slow
+    on Python < 3.12 (and reads `todos` to check for it), so validate a
+    storage once at setup rather than on every request. The toolset itself
+    never performs this check.
+
     Example:
         ```python
         class MyCustomStorage:
@@ -42,13 +79,26 @@ class TodoStorageProtocol(Protocol):
         ...
 
 
-@dataclass
-class TodoStorage:
+class _WeakrefSlot:
+    """Base keeping slotted subclasses weak-referenceable (weakref_slot needs 3.11+)."""
+
+    __slots__ = ("__weakref__",)
+
+
+@dataclass(slots=True)
+class TodoStorage(_WeakrefSlot):
     """Default in-memory todo storage.
 
     Simple implementation that stores todos in memory.
     Use this for standalone agents or testing.
 
+    Attributes:
+        persist_path: Optional JSON file to persist todos to. Existing todos are
+            loaded from it on creation, and it's rewritten on every assignment.
+            A relative path is resolved against the working directory at creation.
+            Initial todos are written to it if it holds none yet; passing them
+            when it does raises ValueError rather than discarding either list.
+
     Example:
         ```python
         from pydantic_ai_todo import create_todo_toolset, TodoStorage
@@ -58,10 +108,33 @@ class TodoStorage:
 
         # After agent runs, access todos directly
         print(storage.todos)
+
+        # Keep todos across sessions
+        storage = TodoStorage(persist_path="todos.json")
         ```
     """
 
     _todos: list[Todo] = field(default_factory=lambda: [])
+    persist_path: str | Path | None = None
+    _path: Path | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Load previously persisted todos, or persist the initial ones."""
+        if self.persist_path is None:
+            return
+
+        # Resolved once, so a relative path doesn't follow a later chdir
+        path = self._path = Path(self.persist_path).absolute()
+        persisted = _todo_list_adapter.validate_json(path.read_bytes()) if path.exists() else []
+        if not self._todos:
+            self._todos = persisted
+        elif persisted:
+            raise ValueError(
+                f"Initial todos were given but {path} already has persisted todos; "
+                "pass one or the other"
+            )
+        else:
+            _write_atomic(path, _todo_list_adapter.dump_json(self._todos))
 
     @property
     def todos(self) -> list[Todo]:
@@ -71,4 +144,7 @@ class TodoStorage:
     @todos.setter
     def todos(self, value: list[Todo]) -> None:
         """Set the list of todos."""
+        # Persist first, so a failed write leaves both copies on the previous list
+        if self._path is not None:
+            _write_atomic(self._path, _todo_list_adapter.dump_json(value))
         self._todos = value
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import copy
+import operator
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from functools import cache
 from typing import Any
 
+from pydantic_ai import Tool
 from pydantic_ai.toolsets import FunctionToolset
 
 from pydantic_ai_todo.storage import TodoStorage, TodoStorageProtocol
-from pydantic_ai_todo.types import Todo, TodoItem
+from pydantic_ai_todo.types import Todo
 
 TODO_TOOL_DESCRIPTION = """
 Use this tool to create and manage a structured task list for your current session.
@@ -59,6 +66,151 @@ Use this tool to check the current status of all tasks before:
 Returns all todos with their current status (pending, in_progress, completed).
 """
 
+# Static head of the system prompt when there are todos to list.
+_PROMPT_PREFIX_WITH_HEADER = TODO_SYSTEM_PROMPT + "\n\n## Current Todos\n"
+
+# Status is a validated Literal, so every todo has one of these keys.
+_STATUS_ICON = {
+    "pending": "[ ]",
+    "in_progress": "[*]",
+    "completed": "[x]",
+}
+
+# Index of each status in the counts lists used for summaries.
+_STATUS_IDX = {
+    "pending": 0,
+    "in_progress": 1,
+    "completed": 2,
+}
+
+# Last rendered output per TodoStorage (by id) and renderer, stored with the list it
+# was rendered from and a snapshot of its items. A miss overwrites the entry, and a
+# finalizer drops a storage's entries when it's garbage collected.
+_RenderEntry = tuple[list[Todo], tuple[Todo, ...], str]
+_render_cache: dict[int, dict[Callable[[list[Todo]], str], _RenderEntry]] = {}
+
+
+def _format_todo_list(todos: list[Todo]) -> str:
+    """Format todos for the read_todos tool output."""
+    counts = [0, 0, 0]
+
+    # Format lines and count statuses in a single pass
+    lines: list[str] = []
+    for i, todo in enumerate(todos, 1):
+        status = todo.status
+        counts[_STATUS_IDX[status]] += 1
+        lines.append(f"{i}. {_STATUS_ICON[status]} {todo.content}")
+
+    body = "\n".join(lines)
+    return (
+        f"Current todos:\n{body}\n\n"
+        f"Summary: {counts[2]} completed, {counts[1]} in progress, {counts[0]} pending"
+    )
+
+
+def _format_system_prompt(todos: list[Todo]) -> str:
+    """Format the system prompt section listing current todos."""
+    return _PROMPT_PREFIX_WITH_HEADER + "\n".join(
+        f"- {_STATUS_ICON[todo.status]} {todo.content}" for todo in todos
+    )
+
+
+def _render_cached(storage: TodoStorageProtocol, render: Callable[[list[Todo]], str]) -> str:
+    """Render the storage's todos, reusing the last result while they are unchanged.
+
+    The cached result is only reused if the storage still holds the same list with
+    the same items, so in-place edits and subclasses overriding `todos` are never
+    served stale output. Todos are frozen, so item identity is enough. Only the
+    built-in TodoStorage is cached; other storages are rendered every time.
+    """
+    if not isinstance(storage, TodoStorage):
+        return render(storage.todos)
+
+    todos = storage.todos
+    entries = _render_cache.get(id(storage))
+    if entries is None:
+        entries = _render_cache[id(storage)] = {}
+        weakref.finalize(storage, _render_cache.pop, id(storage), None)
+    else:
+        entry = entries.get(render)
+        if entry is not None:
+            cached_todos, snapshot, result = entry
+            if (
+                cached_todos is todos
+                and len(snapshot) == len(todos)
+                and all(map(operator.is_, snapshot, todos))
+            ):
+                return result
+
+    result = render(todos)
+    entries[render] = (todos, tuple(todos), result)
+    return result
+
+
+def _make_tool_functions(
+    storage: TodoStorageProtocol,
+) -> tuple[Callable[[], Awaitable[str]], Callable[[list[Todo]], Awaitable[str]]]:
+    """Create the read_todos and write_todos tool functions bound to a storage."""
+
+    async def read_todos() -> str:
+        """Read the current todo list."""
+        if not storage.todos:
+            return "No todos in the list. Use write_todos to create tasks."
+
+        return _render_cached(storage, _format_todo_list)
+
+    async def write_todos(todos: list[Todo]) -> str:
+        """Update the todo list with new items.
+
+        Args:
+            todos: List of todo items with content, status, and active_form.
+        """
+        storage.todos = list(todos)
+
+        # Count from the input rather than reading back through the storage
+        counts = [0, 0, 0]
+        for todo in todos:
+            counts[_STATUS_IDX[todo.status]] += 1
+
+        return (
+            f"Updated {len(todos)} todos: "
+            f"{counts[2]} completed, {counts[1]} in progress, {counts[0]} pending"
+        )
+
+    return read_todos, write_todos
+
+
+@cache
+def _tool_templates() -> tuple[Tool[Any], Tool[Any]]:
+    """Build the read_todos and write_todos tools once.
+
+    Generating a tool's argument validator and JSON schema is the expensive part
+    of creating a toolset, and neither depends on the storage the tool is bound to.
+    """
+    read_todos, write_todos = _make_tool_functions(TodoStorage())
+    return (
+        Tool(read_todos, takes_ctx=False, description=READ_TODO_DESCRIPTION),
+        Tool(write_todos, takes_ctx=False, description=TODO_TOOL_DESCRIPTION),
+    )
+
+
+def _bind_tool(template: Tool[Any], function: Callable[..., Any]) -> Tool[Any]:
+    """Copy a template tool onto another function with the same signature.
+
+    The validator is shared; the JSON schema is copied, since tool preparation
+    may mutate it per toolset.
+    """
+    schema = template.function_schema
+    return Tool(
+        function,
+        takes_ctx=False,
+        name=template.name,
+        description=template.description,
+        function_schema=replace(
+            schema, function=function, json_schema=copy.deepcopy(schema.json_schema)
+        ),
+    )
+
 
 def create_todo_toolset(
     storage: TodoStorageProtocol | None = None,
@@ -100,60 +252,12 @@ def create_todo_toolset(
         ```
     """
     _storage = storage if storage is not None else TodoStorage()
+    read_todos, write_todos = _make_tool_functions(_storage)
+    read_template, write_template = _tool_templates()
 
     toolset: FunctionToolset[Any] = FunctionToolset(id=id)
-
-    @toolset.tool(description=READ_TODO_DESCRIPTION)
-    async def read_todos() -> str:
-        """Read the current todo list."""
-        if not _storage.todos:
-            return "No todos in the list. Use write_todos to create tasks."
-
-        lines = ["Current todos:"]
-        for i, todo in enumerate(_storage.todos, 1):
-            status_icon = {
-                "pending": "[ ]",
-                "in_progress": "[*]",
-                "completed": "[x]",
-            }.get(todo.status, "[ ]")
-            lines.append(f"{i}. {status_icon} {todo.content}")
-
-        # Add summary
-        counts = {"pending": 0, "in_progress": 0, "completed": 0}
-        for todo in _storage.todos:
-            counts[todo.status] += 1
-
-        lines.append("")
-        lines.append(
-            f"Summary: {counts['completed']} completed, "
-            f"{counts['in_progress']} in progress, "
-            f"{counts['pending']} pending"
-        )
-
-        return "\n".join(lines)
-
-    @toolset.tool(description=TODO_TOOL_DESCRIPTION)
-    async def write_todos(todos: list[TodoItem]) -> str:
-        """Update the todo list with new items.
-
-        Args:
-            todos: List of todo items with content, status, and active_form.
-        """
-        _storage.todos = [
-            Todo(content=t.content, status=t.status, active_form=t.active_form) for t in todos
-        ]
-
-        # Count by status
-        counts = {"pending": 0, "in_progress": 0, "completed": 0}
-        for todo in _storage.todos:
-            counts[todo.status] += 1
-
-        return (
-            f"Updated {len(todos)} todos: "
-            f"{counts['completed']} completed, "
-            f"{counts['in_progress']} in progress, "
-            f"{counts['pending']} pending"
-        )
+    toolset.add_tool(_bind_tool(read_template, read_todos))
+    toolset.add_tool(_bind_tool(write_template, write_todos))
 
     return toolset
 
@@ -170,14 +274,4 @@ def get_todo_system_prompt(storage: TodoStorageProtocol | None = None) -> str:
     if storage is None or not storage.todos:
         return TODO_SYSTEM_PROMPT
 
-    lines = [TODO_SYSTEM_PROMPT, "", "## Current Todos"]
-
-    for todo in storage.todos:
-        status_icon = {
-            "pending": "[ ]",
-            "in_progress": "[*]",
-            "completed": "[x]",
-        }.get(todo.status, "[ ]")
-        lines.append(f"- {status_icon} {todo.content}")
-
-    return "\n".join(lines)
+    return _render_cached(storage, _format_system_prompt)
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Todo(BaseModel):
     """A todo item for task tracking.
 
+    This is also the input model for the write_todos tool, so fields carry
+    descriptions for LLM guidance and parsed tool input is stored as-is.
+    Todos are immutable (a breaking change from earlier releases, which allowed
+    field assignment); use `model_copy(update=...)` to derive a changed one.
+
     Attributes:
         content: The task description in imperative form (e.g., 'Implement feature X').
         status: Task status - 'pending', 'in_progress', or 'completed'.
@@ -17,17 +22,11 @@ class Todo(BaseModel):
             (e.g., 'Implementing feature X').
     """
 
-    content: str
-    status: Literal["pending", "in_progress", "completed"]
-    active_form: str
-
-
-class TodoItem(BaseModel):
-    """Input model for the write_todos tool.
-
-    This is the model that agents use when calling write_todos.
-    It has the same fields as Todo but with Field descriptions for LLM guidance.
-    """
+    # The docstring is developer documentation; keep the LLM-facing schema short.
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={"description": "A task in the todo list."},
+    )
 
     content: str = Field(
         ..., description="The task description in imperative form (e.g., 'Implement feature X')"
@@ -39,3 +38,7 @@ class TodoItem(BaseModel):
         ...,
         description="Present continuous form during execution (e.g., 'Implementing feature X')",
     )
+
+
+TodoItem = Todo
+"""Input model for the write_todos tool (alias of `Todo`, kept for backwards compatibility)."""
@@ -1,5 +1,14 @@
 """Tests for pydantic_ai_todo.storage module."""
 
+import json
+import os
+import stat
+import weakref
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
 from pydantic_ai_todo import Todo, TodoStorage, TodoStorageProtocol
 
 
@@ -43,6 +52,148 @@ class TestTodoStorage:
         storage.todos = []
         assert storage.todos == []
 
+    def test_uses_slots(self) -> None:
+        """Test that storage instances don't carry a per-instance __dict__."""
+        storage = TodoStorage()
+        assert not hasattr(storage, "__dict__")
+
+    def test_supports_weakref(self) -> None:
+        """Test that storage instances can still be weakly referenced."""
+        storage = TodoStorage()
+        assert weakref.ref(storage)() is storage
+
+
+class TestTodoStoragePersistence:
+    """Tests for TodoStorage persistence to a JSON file."""
+
+    def test_missing_file_starts_empty(self, tmp_path: Path) -> None:
+        """Test that a storage with a new persist path starts empty."""
+        path = tmp_path / "todos.json"
+        storage = TodoStorage(persist_path=path)
+        assert storage.todos == []
+        assert not path.exists()
+
+    def test_assignment_writes_file(self, tmp_path: Path) -> None:
+        """Test that assigning todos writes them as JSON."""
+        path = tmp_path / "todos.json"
+        storage = TodoStorage(persist_path=path)
+        storage.todos = [
+            Todo(content="Task 1", status="in_progress", active_form="Working on Task 1"),
+        ]
+
+        assert json.loads(path.read_bytes()) == [
+            {"content": "Task 1", "status": "in_progress", "active_form": "Working on Task 1"},
+        ]
+
+    def test_failed_write_keeps_previous_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failed write keeps the previous todos and leaves no temp files."""
+        path = tmp_path / "todos.json"
+        storage = TodoStorage(persist_path=path)
+        storage.todos = [Todo(content="Task 1", status="pending", active_form="Working")]
+        previous = path.read_bytes()
+
+        def fail_replace(src: str, dst: Path) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("pydantic_ai_todo.storage.os.replace", fail_replace)
+        with pytest.raises(OSError, match="disk full"):
+            storage.todos = [Todo(content="Task 2", status="pending", active_form="Working")]
+
+        assert path.read_bytes() == previous
+        assert list(tmp_path.iterdir()) == [path]
+        assert storage.todos[0].content == "Task 1"
+
+    def test_rewrite_keeps_file_mode(self, tmp_path: Path) -> None:
+        """Test that rewriting the file keeps its existing permissions."""
+        path = tmp_path / "todos.json"
+        path.write_text("[]")
+        path.chmod(0o640)
+        storage = TodoStorage(persist_path=path)
+
+        storage.todos = [Todo(content="Task", status="pending", active_form="Working")]
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_new_file_honours_umask(self, tmp_path: Path) -> None:
+        """Test that a newly created file gets the default mode, not a private one."""
+        path = tmp_path / "todos.json"
+        previous = os.umask(0o022)
+        try:
+            TodoStorage(persist_path=path).todos = [
+                Todo(content="Task", status="pending", active_form="Working"),
+            ]
+        finally:
+            os.umask(previous)
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    def test_loads_persisted_todos(self, tmp_path: Path) -> None:
+        """Test that a new storage loads todos written by a previous one."""
+        path = str(tmp_path / "todos.json")
+        todos = [
+            Todo(content="Task 1", status="pending", active_form="Working on Task 1"),
+            Todo(content="Task 2", status="completed", active_form="Working on Task 2"),
+        ]
+        TodoStorage(persist_path=path).todos = todos
+
+        assert TodoStorage(persist_path=path).todos == todos
+
+    def test_initial_todos_written_to_new_file(self, tmp_path: Path) -> None:
+        """Test that initial todos are persisted when the file doesn't exist yet."""
+        path = tmp_path / "todos.json"
+        todos = [Todo(content="Task 1", status="pending", active_form="Working")]
+
+        TodoStorage(todos, persist_path=path)
+
+        assert TodoStorage(persist_path=path).todos == todos
+
+    def test_initial_todos_with_existing_file_raises(self, tmp_path: Path) -> None:
+        """Test that initial todos and an existing file can't silently override each other."""
+        path = tmp_path / "todos.json"
+        TodoStorage(persist_path=path).todos = [
+            Todo(content="Saved", status="pending", active_form="Working"),
+        ]
+
+        with pytest.raises(ValueError, match="already has persisted todos"):
+            TodoStorage(
+                [Todo(content="Initial", status="pending", active_form="Working")],
+                persist_path=path,
+            )
+        assert TodoStorage(persist_path=path).todos[0].content == "Saved"
+
+    def test_initial_todos_with_empty_file(self, tmp_path: Path) -> None:
+        """Test that a file holding no todos doesn't block initial todos."""
+        path = tmp_path / "todos.json"
+        path.write_text("[]")
+        todos = [Todo(content="Task 1", status="pending", active_form="Working")]
+
+        assert TodoStorage(todos, persist_path=path).todos == todos
+        assert TodoStorage(persist_path=path).todos == todos
+
+    def test_relative_path_resolved_at_creation(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a relative path keeps pointing at the same file after a chdir."""
+        (tmp_path / "other").mkdir()
+        monkeypatch.chdir(tmp_path)
+        storage = TodoStorage(persist_path="todos.json")
+
+        monkeypatch.chdir(tmp_path / "other")
+        storage.todos = [Todo(content="Task 1", status="pending", active_form="Working")]
+
+        assert (tmp_path / "todos.json").exists()
+        assert not (tmp_path / "other" / "todos.json").exists()
+
+    def test_invalid_file_raises(self, tmp_path: Path) -> None:
+        """Test that a persisted file with invalid todos is rejected on load."""
+        path = tmp_path / "todos.json"
+        path.write_text('[{"content": "Task", "status": "invalid", "active_form": "Working"}]')
+
+        with pytest.raises(ValidationError):
+            TodoStorage(persist_path=path)
+
 
 class TestTodoStorageProtocol:
     """Tests for TodoStorageProtocol."""
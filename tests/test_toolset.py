@@ -1,17 +1,38 @@
 """Tests for pydantic_ai_todo.toolset module."""
 
+import asyncio
+import gc
 from typing import Any
 
 import pytest
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
 from pydantic_ai.toolsets import FunctionToolset
 
 from pydantic_ai_todo import (
+    TODO_SYSTEM_PROMPT,
     Todo,
     TodoItem,
     TodoStorage,
     create_todo_toolset,
     get_todo_system_prompt,
 )
+from pydantic_ai_todo.toolset import _render_cache  # pyright: ignore[reportPrivateUsage]
+
+
+class CustomStorage:
+    """Storage implementing the protocol without subclassing TodoStorage."""
+
+    def __init__(self) -> None:
+        self._data: list[Todo] = []
+
+    @property
+    def todos(self) -> list[Todo]:
+        return self._data
+
+    @todos.setter
+    def todos(self, value: list[Todo]) -> None:
+        self._data = value
 
 
 class TestCreateTodoToolset:
@@ -50,6 +71,44 @@ class TestCreateTodoToolset:
         # They should be different instances
         assert toolset1 is not toolset2
 
+    def test_tools_reuse_schema_across_toolsets(self) -> None:
+        """Test that toolsets share validators but own their schemas and functions."""
+        toolset1 = create_todo_toolset()
+        toolset2 = create_todo_toolset()
+
+        for name in ("read_todos", "write_todos"):
+            tool1, tool2 = toolset1.tools[name], toolset2.tools[name]
+            schema1, schema2 = tool1.function_schema, tool2.function_schema
+            assert schema1.validator is schema2.validator
+            assert schema1.json_schema == schema2.json_schema
+            assert schema1.json_schema is not schema2.json_schema
+            assert tool1.function is not tool2.function
+            assert schema1.function is tool1.function
+
+            schema1.json_schema["description"] = "changed"
+            assert schema2.json_schema.get("description") != "changed"
+
+    def test_write_todos_schema_description_is_concise(self) -> None:
+        """Test that the Todo model description sent to the LLM omits developer docs."""
+        toolset = create_todo_toolset()
+        schema = toolset.tools["write_todos"].tool_def.parameters_json_schema
+
+        assert schema["$defs"]["Todo"]["description"] == "A task in the todo list."
+
+    async def test_agent_calls_use_own_storage(self) -> None:
+        """Test that tool calls from an agent reach only that toolset's storage."""
+        storage1 = TodoStorage()
+        storage2 = TodoStorage()
+        toolset = create_todo_toolset(storage=storage1)
+        create_todo_toolset(storage=storage2)
+
+        agent = Agent(TestModel(call_tools=["write_todos"]), toolsets=[toolset])
+        result = await agent.run("Plan the work")
+
+        assert len(storage1.todos) == 1
+        assert storage2.todos == []
+        assert "Updated 1 todos" in result.output
+
 
 class TestReadTodos:
     """Tests for read_todos tool."""
@@ -106,6 +165,104 @@ class TestReadTodos:
         assert "1 completed" in result
         assert "2 pending" in result
 
+    async def test_read_todos_exact_output(
+        self, storage: TodoStorage, toolset: FunctionToolset[Any]
+    ) -> None:
+        """Test the full read_todos output format."""
+        storage.todos = [
+            Todo(content="Task 1", status="completed", active_form="Working"),
+            Todo(content="Task 2", status="in_progress", active_form="Working"),
+            Todo(content="Task 3", status="pending", active_form="Working"),
+        ]
+
+        read_todos = toolset.tools["read_todos"]
+        result = await read_todos.function()  # type: ignore[call-arg]
+
+        assert result == (
+            "Current todos:\n"
+            "1. [x] Task 1\n"
+            "2. [*] Task 2\n"
+            "3. [ ] Task 3\n"
+            "\n"
+            "Summary: 1 completed, 1 in progress, 1 pending"
+        )
+
+    async def test_read_todos_reflects_new_assignment(
+        self, storage: TodoStorage, toolset: FunctionToolset[Any]
+    ) -> None:
+        """Test that cached output is refreshed after todos are reassigned."""
+        storage.todos = [Todo(content="Task 1", status="pending", active_form="Working")]
+        read_todos = toolset.tools["read_todos"]
+        first = await read_todos.function()  # type: ignore[call-arg]
+        assert await read_todos.function() is first  # type: ignore[call-arg]
+
+        storage.todos = [Todo(content="Task 2", status="completed", active_form="Working")]
+        result = await read_todos.function()  # type: ignore[call-arg]
+
+        assert "Task 2" in result
+        assert "Task 1" not in result
+
+    async def test_read_todos_reflects_in_place_edits(
+        self, storage: TodoStorage, toolset: FunctionToolset[Any]
+    ) -> None:
+        """Test that editing the stored list in place is never served stale."""
+        storage.todos = [Todo(content="Task 1", status="pending", active_form="Working")]
+        read_todos = toolset.tools["read_todos"]
+        await read_todos.function()  # type: ignore[call-arg]
+
+        storage.todos.append(Todo(content="Task 2", status="completed", active_form="Working"))
+        result = await read_todos.function()  # type: ignore[call-arg]
+        assert "2. [x] Task 2" in result
+        assert "1 completed, 0 in progress, 1 pending" in result
+
+        storage.todos[0] = Todo(content="Task 3", status="in_progress", active_form="Working")
+        result = await read_todos.function()  # type: ignore[call-arg]
+        assert "1. [*] Task 3" in result
+        assert "Task 1" not in result
+
+    async def test_read_todos_subclass_overriding_todos(self) -> None:
+        """Test that a subclass overriding todos still sees its own writes."""
+
+        class SubclassStorage(TodoStorage):
+            __slots__ = ("items",)
+
+            def __init__(self) -> None:
+                super().__init__()
+                self.items: list[Todo] = []
+
+            @property
+            def todos(self) -> list[Todo]:
+                return self.items
+
+            @todos.setter
+            def todos(self, value: list[Todo]) -> None:
+                self.items = value
+
+        toolset = create_todo_toolset(storage=SubclassStorage())
+        read_todos = toolset.tools["read_todos"]
+        write_todos = toolset.tools["write_todos"]
+
+        items = [TodoItem(content="X", status="pending", active_form="Working")]
+        await write_todos.function(todos=items)  # type: ignore[call-arg]
+        assert "1. [ ] X" in await read_todos.function()  # type: ignore[call-arg]
+
+        items = [TodoItem(content="Y", status="pending", active_form="Working")]
+        await write_todos.function(todos=items)  # type: ignore[call-arg]
+        result = await read_todos.function()  # type: ignore[call-arg]
+        assert "1. [ ] Y" in result
+        assert "X" not in result
+
+    async def test_read_todos_custom_storage(self) -> None:
+        """Test reading todos from a custom protocol storage."""
+        storage = CustomStorage()
+        toolset = create_todo_toolset(storage=storage)
+        storage.todos = [Todo(content="Task 1", status="pending", active_form="Working")]
+        read_todos = toolset.tools["read_todos"]
+
+        result = await read_todos.function()  # type: ignore[call-arg]
+
+        assert "1. [ ] Task 1" in result
+
 
 class TestWriteTodos:
     """Tests for write_todos tool."""
@@ -170,6 +327,74 @@ class TestWriteTodos:
         assert "1 in progress" in result
         assert "1 pending" in result
 
+    async def test_concurrent_writes_on_shared_storage(self, storage: TodoStorage) -> None:
+        """Test that concurrent writes from agents sharing a storage don't interleave."""
+        toolsets = [create_todo_toolset(storage=storage) for _ in range(3)]
+        batches = [
+            [
+                TodoItem(content=f"Agent {i} task {j}", status="pending", active_form="Working")
+                for j in range(i + 1)
+            ]
+            for i in range(len(toolsets))
+        ]
+
+        results = await asyncio.gather(
+            *(
+                toolset.tools["write_todos"].function(todos=batch)  # type: ignore[call-arg]
+                for toolset, batch in zip(toolsets, batches, strict=True)
+            )
+        )
+
+        assert [r.split(":")[0] for r in results] == [
+            "Updated 1 todos",
+            "Updated 2 todos",
+            "Updated 3 todos",
+        ]
+        # Last writer wins with its complete list
+        assert storage.todos == batches[-1]
+
+    async def test_write_todos_does_not_read_back_storage(self) -> None:
+        """Test that write_todos assigns once and never reads the storage back."""
+
+        class WriteOnlyStorage:
+            def __init__(self) -> None:
+                self.written: list[list[Todo]] = []
+
+            @property
+            def todos(self) -> list[Todo]:
+                raise AssertionError("write_todos should not read storage.todos")
+
+            @todos.setter
+            def todos(self, value: list[Todo]) -> None:
+                self.written.append(value)
+
+        storage = WriteOnlyStorage()
+        toolset = create_todo_toolset(storage=storage)
+        items = [
+            TodoItem(content="Task 1", status="pending", active_form="Working"),
+            TodoItem(content="Task 2", status="completed", active_form="Working"),
+        ]
+
+        result = await toolset.tools["write_todos"].function(todos=items)  # type: ignore[call-arg]
+
+        assert storage.written == [items]
+        assert "1 completed, 0 in progress, 1 pending" in result
+
+    async def test_write_todos_stores_parsed_todos(
+        self, storage: TodoStorage, toolset: FunctionToolset[Any]
+    ) -> None:
+        """Test that parsed tool input is stored as-is, in a copied list."""
+        write_todos = toolset.tools["write_todos"]
+        items = [
+            TodoItem(content="Task 1", status="pending", active_form="Working on Task 1"),
+            TodoItem(content="Task 2", status="completed", active_form="Working on Task 2"),
+        ]
+        await write_todos.function(todos=items)  # type: ignore[call-arg]
+
+        assert storage.todos is not items
+        assert len(storage.todos) == len(items)
+        assert all(stored is item for stored, item in zip(storage.todos, items, strict=True))
+
 
 class TestGetTodoSystemPrompt:
     """Tests for get_todo_system_prompt function."""
@@ -218,3 +443,75 @@ class TestGetTodoSystemPrompt:
         assert "[ ] Pending" in prompt
         assert "[*] In Progress" in prompt
         assert "[x] Completed" in prompt
+
+    def test_prompt_exact_output(self) -> None:
+        """Test the full prompt format with todos."""
+        storage = TodoStorage()
+        storage.todos = [
+            Todo(content="Task 1", status="completed", active_form="Working"),
+            Todo(content="Task 2", status="pending", active_form="Working"),
+        ]
+
+        prompt = get_todo_system_prompt(storage)
+
+        assert prompt == f"{TODO_SYSTEM_PROMPT}\n\n## Current Todos\n- [x] Task 1\n- [ ] Task 2"
+
+    def test_prompt_cached_until_todos_change(self) -> None:
+        """Test that the prompt is reused until todos are reassigned."""
+        storage = TodoStorage()
+        storage.todos = [Todo(content="Task 1", status="pending", active_form="Working")]
+
+        first = get_todo_system_prompt(storage)
+        assert get_todo_system_prompt(storage) is first
+
+        storage.todos = [Todo(content="Task 2", status="pending", active_form="Working")]
+        prompt = get_todo_system_prompt(storage)
+        assert "Task 2" in prompt
+        assert "Task 1" not in prompt
+
+    def test_prompt_reflects_in_place_edits(self) -> None:
+        """Test that the cached prompt is refreshed after in-place list edits."""
+        storage = TodoStorage()
+        storage.todos = [Todo(content="Task 1", status="pending", active_form="Working")]
+        get_todo_system_prompt(storage)
+
+        storage.todos.append(Todo(content="Task 2", status="pending", active_form="Working"))
+
+        assert "- [ ] Task 2" in get_todo_system_prompt(storage)
+
+    async def test_repeated_writes_keep_one_entry_per_renderer(self) -> None:
+        """Test that rewriting one storage doesn't grow the retained render cache."""
+        storage = TodoStorage()
+        toolset = create_todo_toolset(storage=storage)
+        read_todos = toolset.tools["read_todos"]
+        write_todos = toolset.tools["write_todos"]
+
+        for i in range(20):
+            items = [TodoItem(content=f"Task {i}", status="pending", active_form="Working")]
+            await write_todos.function(todos=items)  # type: ignore[call-arg]
+            assert f"Task {i}" in await read_todos.function()  # type: ignore[call-arg]
+            assert f"Task {i}" in get_todo_system_prompt(storage)
+
+        entries = _render_cache[id(storage)]
+        assert len(entries) == 2
+        assert all(todos is storage.todos for todos, _, _ in entries.values())
+
+    def test_render_cache_released_with_storage(self) -> None:
+        """Test that a storage's cached output is dropped when it's garbage collected."""
+        storage = TodoStorage()
+        storage.todos = [Todo(content="Task", status="pending", active_form="Working")]
+        get_todo_system_prompt(storage)
+        key = id(storage)
+        assert key in _render_cache
+
+        del storage
+        gc.collect()
+
+        assert key not in _render_cache
+
+    def test_prompt_custom_storage(self) -> None:
+        """Test system prompt for a custom protocol storage."""
+        storage = CustomStorage()
+        storage.todos = [Todo(content="Task 1", status="completed", active_form="Working")]
+
+        assert "- [x] Task 1" in get_todo_system_prompt(storage)
@@ -31,6 +31,16 @@ class TestTodo:
         with pytest.raises(ValidationError):
             Todo(content="Task", status="invalid", active_form="Working")  # type: ignore[arg-type]
 
+    def test_todo_is_frozen(self) -> None:
+        """Test that todos can't be mutated in place."""
+        todo = Todo(content="Task", status="pending", active_form="Working")
+        with pytest.raises(ValidationError):
+            todo.status = "completed"  # type: ignore[misc]
+
+        updated = todo.model_copy(update={"status": "completed"})
+        assert updated.status == "completed"
+        assert todo.status == "pending"
+
     def test_todo_model_dump(self) -> None:
         """Test serialization to dict."""
         todo = Todo(
@@ -49,6 +59,10 @@ class TestTodo:
 class TestTodoItem:
     """Tests for TodoItem model."""
 
+    def test_todo_item_is_todo(self) -> None:
+        """Test that TodoItem is an alias of Todo, so tool input is stored verbatim."""
+        assert TodoItem is Todo
+
     def test_create_todo_item(self) -> None:
         """Test creating a valid todo item."""
         item = TodoItem(
@@ -69,6 +83,14 @@ class TestTodoItem:
         assert "description" in props["status"]
         assert "description" in props["active_form"]
 
+    def test_todo_item_status_schema(self) -> None:
+        """Test that the tool schema offers statuses as the strings the prompts mention."""
+        schema = TodoItem.model_json_schema()
+        status = schema["properties"]["status"]
+
+        assert status["type"] == "string"
+        assert status["enum"] == ["pending", "in_progress", "completed"]
+
     def test_todo_item_invalid_status(self) -> None:
         """Test that invalid status raises validation error."""
         with pytest.raises(ValidationError):